@@ -80,6 +80,14 @@ class Product(db.Model):
         db.Enum(Category), nullable=False, server_default=(Category.UNKNOWN.name)
     )
 
+    # Back the find_by_* queries with an index on each filter column
+    __table_args__ = (
+        db.Index("ix_product_name", "name"),
+        db.Index("ix_product_available", "available"),
+        db.Index("ix_product_category", "category"),
+        db.Index("ix_product_price", "price"),
+    )
+
     ##################################################
     # INSTANCE METHODS
     ##################################################
@@ -87,15 +95,21 @@ class Product(db.Model):
     def __repr__(self):
         return f"<Product {self.name} id=[{self.id}]>"
 
-    def create(self):
+    def create(self, commit: bool = True):
         """
         Creates a Product to the database
+
+        :param commit: False to leave the commit to the caller so that
+            several products can be saved in one transaction
+        :type commit: bool
+
         """
         logger.info("Creating %s", self.name)
         # id must be none to generate next primary key
         self.id = None  # pylint: disable=invalid-name
         db.session.add(self)
-        db.session.commit()
+        if commit:
+            db.session.commit()
 
     def update(self):
         """
@@ -175,6 +189,12 @@ class Product(db.Model):
         logger.info("Processing all Products")
         return cls.query.all()
 
+    @classmethod
+    def count(cls) -> int:
+        """Returns the number of Products in the database"""
+        logger.info("Processing count of all Products")
+        return db.session.query(db.func.count(cls.id)).scalar()
+
     @classmethod
     def find(cls, product_id: int):
         """Finds a Product by it's ID
@@ -0,0 +1,31 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+pytest configuration
+
+The tests can be spread over several processes with pytest-xdist:
+    pytest -n auto
+
+Each worker clones its own model test database from the template, and
+the --dist loadfile in setup.cfg keeps the route tests, which share the
+app database, on a single worker.
+"""
+from tests import database
+
+
+def pytest_configure(config):
+    """Builds the template database before any xdist worker starts"""
+    if not hasattr(config, "workerinput"):  # only in the controller process
+        database.create_template()